@@ -12,7 +12,8 @@ from pathlib import Path
 
 # Add parent directory to Python path for relative imports
 PLUGIN_DIR = Path(__file__).parent
-sys.path.insert(0, str(PLUGIN_DIR.parent))
+if str(PLUGIN_DIR.parent) not in sys.path:
+    sys.path.insert(0, str(PLUGIN_DIR.parent))
 
 from .config import VERSION, PROJECT_NAME
 
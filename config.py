@@ -226,6 +226,10 @@ DEFAULT_UI_CONFIG = UIConfig()
 # Log message format
 LOG_FORMAT = "[{timestamp}] [{level}] {message}"
 
+# Verbose diagnostic output (per-node workflow dumps, etc.)
+# Enable with COMFYUI_TO_WEBUI_DEBUG=1
+DEBUG_LOGGING = os.environ.get("COMFYUI_TO_WEBUI_DEBUG", "").lower() in {"1", "true", "yes"}
+
 # Log levels
 class LogLevel:
     DEBUG = "DEBUG"
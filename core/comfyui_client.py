@@ -413,7 +413,8 @@ class ComfyUIClient:
 
             buf = io.BytesIO()
             filename = f"{filename_prefix}_{int(time.time()*1000)}.png"
-            image.save(buf, format="PNG")
+            # Transient local upload; favour encode speed over payload size
+            image.save(buf, format="PNG", compress_level=1)
             buf.seek(0)
 
             files = {"image": (filename, buf, "image/png")}
@@ -12,6 +12,7 @@ Uses standard ComfyUI nodes (no custom Hua_Output nodes required)
 
 import time
 import os
+import stat
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
@@ -219,7 +220,8 @@ class ResultRetriever:
                     img_info.get("subfolder", ""),
                     img_info.get("type", "output")
                 )
-                if path and path.exists():
+                # _resolve_output_path already verified existence
+                if path:
                     images.append(str(path))
 
             # Extract videos from VHS_VideoCombine nodes
@@ -229,7 +231,7 @@ class ResultRetriever:
                     video_info.get("subfolder", ""),
                     video_info.get("type", "output")
                 )
-                if path and path.exists():
+                if path:
                     videos.append(str(path))
 
         return images, videos
@@ -283,18 +285,26 @@ class ResultRetriever:
 
         try:
             for file_path in self._output_dir.rglob("*"):
-                if not file_path.is_file():
+                # Check file extension first - it needs no syscall
+                ext = file_path.suffix.lower()
+                is_image = ext in {".png", ".jpg", ".jpeg", ".webp"}
+                if not is_image and ext not in {".mp4", ".webm", ".gif"}:
                     continue
 
-                if file_path.stat().st_mtime < cutoff_time:
+                # One stat covers both the regular-file and recency checks
+                try:
+                    file_stat = file_path.stat()
+                except OSError:
+                    continue
+                if not stat.S_ISREG(file_stat.st_mode):
                     continue
 
-                # Check file extension
-                ext = file_path.suffix.lower()
+                if file_stat.st_mtime < cutoff_time:
+                    continue
 
-                if ext in {".png", ".jpg", ".jpeg", ".webp"}:
+                if is_image:
                     images.append(str(file_path))
-                elif ext in {".mp4", ".webm", ".gif"}:
+                else:
                     videos.append(str(file_path))
 
         except Exception:
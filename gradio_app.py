@@ -31,6 +31,7 @@ import inspect
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Dict, Any
 
@@ -40,7 +41,9 @@ os.environ["GRADIO_ANALYTICS_ENABLED"] = "False"
 # Handle both ComfyUI import and direct execution
 if __name__ == "__main__" and __package__ is None:
     # Direct execution - add parent to path for imports
-    sys.path.insert(0, str(Path(__file__).parent.parent))
+    _parent_dir = str(Path(__file__).parent.parent)
+    if _parent_dir not in sys.path:
+        sys.path.insert(0, _parent_dir)
     from ComfyUI_to_webui.core.comfyui_client import ComfyUIClient
     from ComfyUI_to_webui.core.ui_generator import UIGenerator, GeneratedUI
     from ComfyUI_to_webui.core.execution_engine import ExecutionEngine
@@ -52,9 +55,10 @@ if __name__ == "__main__" and __package__ is None:
     )
     from ComfyUI_to_webui.features.live_preview import ComfyUIPreviewer
     from ComfyUI_to_webui.features import civitai_browser
-    from ComfyUI_to_webui.utils.settings import get_setting, set_setting
+    from ComfyUI_to_webui.utils.settings import get_setting, set_setting, write_json_atomic
     from ComfyUI_to_webui.config import (
         COMFYUI_BASE_URL,
+        DEBUG_LOGGING,
         GRADIO_PORTS,
         VERSION,
         PROJECT_NAME,
@@ -73,9 +77,10 @@ else:
     )
     from .features.live_preview import ComfyUIPreviewer
     from .features import civitai_browser
-    from .utils.settings import get_setting, set_setting
+    from .utils.settings import get_setting, set_setting, write_json_atomic
     from .config import (
         COMFYUI_BASE_URL,
+        DEBUG_LOGGING,
         GRADIO_PORTS,
         VERSION,
         PROJECT_NAME,
@@ -314,6 +319,8 @@ class ComfyUIGradioApp:
         # Image history file path
         self.image_history_file = Path(__file__).parent / "image_history.json"
         self.image_history = self._load_image_history()
+        # Single worker keeps history writes ordered
+        self._history_writer = ThreadPoolExecutor(max_workers=1)
 
     def _find_workflows_directory(self) -> Optional[Path]:
         """Find the ComfyUI workflows directory"""
@@ -340,8 +347,19 @@ class ComfyUIGradioApp:
         if self.workflows_dir is None:
             return {}
 
+        # Single directory pass; DirEntry.is_file() reuses the cached d_type
+        try:
+            with os.scandir(self.workflows_dir) as entries:
+                json_names = sorted(
+                    entry.name for entry in entries
+                    if entry.name.endswith(".json") and entry.is_file()
+                )
+        except OSError:
+            return {}
+
         workflows = {}
-        for json_file in sorted(self.workflows_dir.glob("*.json")):
+        for name in json_names:
+            json_file = self.workflows_dir / name
             # Use filename without extension as display name
             display_name = json_file.stem
             workflows[display_name] = str(json_file)
@@ -367,34 +385,35 @@ class ComfyUIGradioApp:
 
         loaders = {}
 
-        # DEBUG: Print all nodes to understand structure
-        print("[GradioApp] === ALL NODES IN WORKFLOW ===")
-        for node_id, node_data in self.current_workflow.items():
-            class_type = node_data.get("class_type", "")
-            inputs = node_data.get("inputs", {})
-            print(f"  Node {node_id}: {class_type}")
-
-            # Show all top-level keys for lora nodes
-            if "lora" in class_type.lower():
-                print(f"    [DEBUG] All keys in node: {list(node_data.keys())}")
-                if "_meta" in node_data:
-                    print(f"    [DEBUG] _meta: {node_data['_meta']}")
-                if "widgets_values" in node_data:
-                    print(f"    [DEBUG] widgets_values: {node_data['widgets_values']}")
-
-            for param, value in inputs.items():
-                # Print all parameters, not just strings
-                if isinstance(value, str):
-                    display_value = value[:50] if len(str(value)) > 50 else value
-                    print(f"    - {param}: \"{display_value}\" (str)")
-                elif isinstance(value, (int, float, bool)):
-                    print(f"    - {param}: {value} ({type(value).__name__})")
-                elif isinstance(value, list):
-                    # Links are lists like [node_id, output_index]
-                    print(f"    - {param}: {value} (link)")
-                else:
-                    print(f"    - {param}: {type(value).__name__}")
-        print("[GradioApp] === END ALL NODES ===")
+        # DEBUG: Print all nodes to understand structure (per-node output, opt-in)
+        if DEBUG_LOGGING:
+            print("[GradioApp] === ALL NODES IN WORKFLOW ===")
+            for node_id, node_data in self.current_workflow.items():
+                class_type = node_data.get("class_type", "")
+                inputs = node_data.get("inputs", {})
+                print(f"  Node {node_id}: {class_type}")
+
+                # Show all top-level keys for lora nodes
+                if "lora" in class_type.lower():
+                    print(f"    [DEBUG] All keys in node: {list(node_data.keys())}")
+                    if "_meta" in node_data:
+                        print(f"    [DEBUG] _meta: {node_data['_meta']}")
+                    if "widgets_values" in node_data:
+                        print(f"    [DEBUG] widgets_values: {node_data['widgets_values']}")
+
+                for param, value in inputs.items():
+                    # Print all parameters, not just strings
+                    if isinstance(value, str):
+                        display_value = value[:50] if len(str(value)) > 50 else value
+                        print(f"    - {param}: \"{display_value}\" (str)")
+                    elif isinstance(value, (int, float, bool)):
+                        print(f"    - {param}: {value} ({type(value).__name__})")
+                    elif isinstance(value, list):
+                        # Links are lists like [node_id, output_index]
+                        print(f"    - {param}: {value} (link)")
+                    else:
+                        print(f"    - {param}: {type(value).__name__}")
+            print("[GradioApp] === END ALL NODES ===")
 
         # Common loader node patterns
         LOADER_PATTERNS = {
@@ -1362,7 +1381,6 @@ class ComfyUIGradioApp:
         Args:
             All current UI values (sampling/model values are accepted for compatibility but not persisted)
         """
-        import json
         from datetime import datetime
 
         # Only persist prompts and dimensions to avoid overriding sampling/model selections on restore
@@ -1376,8 +1394,7 @@ class ComfyUIGradioApp:
         }
 
         try:
-            with open(self.settings_checkpoint_file, 'w') as f:
-                json.dump(settings, f, indent=2)
+            write_json_atomic(self.settings_checkpoint_file, settings, indent=2)
             print("[GradioApp] ✓ Settings saved (sampling/model params skipped)")
             print(f"[GradioApp] ✓ Settings saved: pos_prompt={settings['positive_prompt'][:50]}...")
         except Exception as e:
@@ -1506,13 +1523,23 @@ class ComfyUIGradioApp:
     def _save_image_history(self):
         """
         Save image history to file
+
+        The write is queued on a single background worker so the execute
+        handler can return results without waiting on disk I/O.
         """
-        import json
+        self._history_writer.submit(self._write_image_history, list(self.image_history))
 
+    def _write_image_history(self, history: list):
+        """
+        Write an image history snapshot to file (runs on the history writer thread)
+
+        Args:
+            history: Snapshot of image paths to persist
+        """
         try:
-            with open(self.image_history_file, 'w') as f:
-                json.dump(self.image_history, f, indent=2)
-            print(f"[GradioApp] ✓ Saved {len(self.image_history)} images to history")
+            # Machine-read file rewritten after every generation - keep it compact
+            write_json_atomic(self.image_history_file, history, separators=(',', ':'))
+            print(f"[GradioApp] ✓ Saved {len(history)} images to history")
         except Exception as e:
             print(f"[GradioApp] Failed to save image history: {e}")
 
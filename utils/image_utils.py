@@ -7,13 +7,19 @@ them without relying on legacy Hua APIs.
 """
 
 import uuid
-from PIL import ImageChops
+from functools import lru_cache
 from pathlib import Path
 from typing import Tuple, Optional, Any
 
+import numpy as np
 from PIL import Image
 
 
+# 256-entry lookup tables for Image.point() on 8-bit masks
+_OPAQUE_ONLY_LUT = [0] * 255 + [255]      # fully opaque -> 255, else 0
+_BINARIZE_LUT = [0] + [255] * 255         # any non-zero -> 255, zero -> 0
+
+
 def extract_image_and_mask(image_data: Any) -> Tuple[Optional[Image.Image], Optional[Image.Image]]:
     """
     Extract base image and mask from Gradio ImageEditor output.
@@ -45,15 +51,17 @@ def extract_image_and_mask(image_data: Any) -> Tuple[Optional[Image.Image], Opti
                     comp_rgb = composite.convert("RGB")
                     base_rgb = base_image.convert("RGB")
                     if comp_rgb.size == base_rgb.size:
-                        diff = ImageChops.difference(comp_rgb, base_rgb).convert("L")
-                        mask = diff.point(lambda p: 0 if p > 0 else 255)  # invert: painted areas -> 0, background -> 255
+                        # Single compare pass over both buffers, no intermediate images
+                        painted = (np.asarray(comp_rgb) != np.asarray(base_rgb)).any(axis=2)
+                        # invert: painted areas -> 0, background -> 255
+                        mask = Image.fromarray(np.where(painted, np.uint8(0), np.uint8(255)))
                 except Exception:
                     mask = None
 
             # Last resort: if composite has alpha, use it
             if mask is None and composite and "A" in composite.getbands():
                 alpha = composite.getchannel("A")
-                mask = alpha.point(lambda p: 0 if p < 255 else 255)  # invert so paint -> 0
+                mask = alpha.point(_OPAQUE_ONLY_LUT)  # invert so paint -> 0
                 mask = _normalize_mask(mask)
 
         return base_image, mask
@@ -84,10 +92,25 @@ def _normalize_mask(mask: Any) -> Optional[Image.Image]:
         mask = mask.convert("L")
 
     # Binarize (any painted pixel becomes 255)
-    mask = mask.point(lambda p: 255 if p > 0 else 0)
+    mask = mask.point(_BINARIZE_LUT)
     return mask
 
 
+@lru_cache(maxsize=1)
+def _get_input_directory() -> Optional[Path]:
+    """
+    Resolve ComfyUI's input directory once per process.
+
+    Returns:
+        Path to the input directory, or None outside the ComfyUI runtime.
+    """
+    try:
+        import folder_paths  # Provided by ComfyUI runtime
+        return Path(folder_paths.get_input_directory())
+    except Exception:
+        return None
+
+
 def save_pil_image_to_input(image: Image.Image, prefix: str = "upload") -> Optional[str]:
     """
     Save a PIL image into ComfyUI's input directory and return the relative filename.
@@ -99,18 +122,17 @@ def save_pil_image_to_input(image: Image.Image, prefix: str = "upload") -> Optio
     Returns:
         Relative filename usable by ComfyUI nodes, or None on failure.
     """
-    try:
-        import folder_paths  # Provided by ComfyUI runtime
-    except Exception:
+    input_dir = _get_input_directory()
+    if input_dir is None:
         return None
 
     try:
-        input_dir = Path(folder_paths.get_input_directory())
         input_dir.mkdir(parents=True, exist_ok=True)
 
         filename = f"{prefix}_{uuid.uuid4().hex}.png"
         filepath = input_dir / filename
-        image.save(filepath, format="PNG")
+        # Inputs are consumed once by ComfyUI; favour encode speed over file size
+        image.save(filepath, format="PNG", compress_level=1)
 
         # ComfyUI loaders expect a path relative to the input directory
         return filename
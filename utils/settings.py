@@ -2,12 +2,60 @@
 Settings management for ComfyUI_to_webui V2
 """
 
+import copy
 import json
+import os
+import uuid
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple, Union
 
 SETTINGS_FILE = Path(__file__).parent.parent / "plugin_settings.json"
 
+# Last parsed settings, keyed by the file's (mtime_ns, size) when it was read
+_settings_cache: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
+
+
+def write_json_atomic(path: Union[str, Path], data: Any, **dump_kwargs) -> None:
+    """
+    Write JSON to a file atomically
+
+    The data is written to a temporary file in the same directory, flushed to
+    disk, and then moved over the target with os.replace, so readers never
+    see a partially written file. The target keeps its existing permissions
+    (or gets the umask default when it is new).
+
+    Args:
+        path: Destination file path
+        data: JSON-serializable object
+        **dump_kwargs: Extra arguments for json.dumps (indent, separators, ...)
+    """
+    path = Path(path)
+    text = json.dumps(data, **dump_kwargs)
+
+    # Carry over an existing target's mode; a new file gets the umask default
+    # because the kernel applies it to the 0o666 passed to os.open
+    try:
+        mode = path.stat().st_mode & 0o777
+    except FileNotFoundError:
+        mode = None
+
+    tmp_path = path.parent / f".{path.name}.{uuid.uuid4().hex}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
 
 def load_settings() -> Dict[str, Any]:
     """
@@ -16,17 +64,32 @@ def load_settings() -> Dict[str, Any]:
     Returns:
         Dictionary of settings, or empty dict if file doesn't exist
     """
-    if not SETTINGS_FILE.exists():
+    global _settings_cache
+
+    try:
+        stat = SETTINGS_FILE.stat()
+    except OSError:
         return {}
 
+    # Reuse the parsed dict while the file is unchanged; hand out a deep copy
+    # so callers like set_setting can mutate it (including nested values)
+    # without corrupting the cache
+    cache_key = (stat.st_mtime_ns, stat.st_size)
+    cached = _settings_cache
+    if cached is not None and cached[0] == cache_key:
+        return copy.deepcopy(cached[1])
+
     try:
         with open(SETTINGS_FILE, 'r') as f:
             settings = json.load(f)
-            return settings if isinstance(settings, dict) else {}
+        settings = settings if isinstance(settings, dict) else {}
     except Exception as e:
         print(f"⚠️ Failed to load settings: {e}")
         return {}
 
+    _settings_cache = (cache_key, settings)
+    return copy.deepcopy(settings)
+
 
 def save_settings(settings: Dict[str, Any]) -> str:
     """
@@ -38,9 +101,12 @@ def save_settings(settings: Dict[str, Any]) -> str:
     Returns:
         Status message
     """
+    global _settings_cache
+
     try:
-        with open(SETTINGS_FILE, 'w') as f:
-            json.dump(settings, f, indent=4)
+        write_json_atomic(SETTINGS_FILE, settings, indent=4)
+        # Force a re-read even if the new file's mtime/size match the old one
+        _settings_cache = None
         return "✅ Settings saved successfully"
     except Exception as e:
         return f"❌ Failed to save settings: {e}"
@@ -49,6 +49,17 @@ class TypeMapper:
         """
         self.ui_config = ui_config or DEFAULT_UI_CONFIG
 
+        # Primitive type -> component factory (COMBO lists are handled separately)
+        self._factories = {
+            "INT": self._create_int_component,
+            "INTEGER": self._create_int_component,
+            "FLOAT": self._create_float_component,
+            "DOUBLE": self._create_float_component,
+            "STRING": self._create_string_component,
+            "BOOLEAN": self._create_boolean_component,
+            "BOOL": self._create_boolean_component,
+        }
+
     def create_component(
         self,
         input_name: str,
@@ -85,21 +96,10 @@ class TypeMapper:
         if isinstance(type_def, list):
             return self._create_dropdown(label, type_def, current_value, metadata)
 
-        # INT type
-        if type_def in {"INT", "INTEGER"}:
-            return self._create_int_component(label, current_value, metadata)
-
-        # FLOAT type
-        if type_def in {"FLOAT", "DOUBLE"}:
-            return self._create_float_component(label, current_value, metadata)
-
-        # STRING type
-        if type_def == "STRING":
-            return self._create_string_component(label, current_value, metadata)
-
-        # BOOLEAN type
-        if type_def in {"BOOLEAN", "BOOL"}:
-            return self._create_boolean_component(label, current_value, metadata)
+        # Primitive types (INT, FLOAT, STRING, BOOLEAN and aliases)
+        factory = self._factories.get(type_def)
+        if factory is not None:
+            return factory(label, current_value, metadata)
 
         # Complex types (MODEL, IMAGE, LATENT, etc.) - non-editable
         if type_def in COMPLEX_TYPES:
@@ -8,7 +8,117 @@ Copied and adapted from V1 kelnel_ui/ui_def.py:283-386
 """
 
 import json
-from typing import Dict, Any, Optional
+import sys
+from typing import Dict, Any, Optional, List, Callable, Tuple
+
+try:
+    import orjson  # Optional: much faster parsing of large workflow graphs
+except ImportError:
+    orjson = None
+
+
+def _match_number(candidate: Any) -> bool:
+    """INT/FLOAT widgets accept any non-bool number"""
+    return isinstance(candidate, (int, float)) and not isinstance(candidate, bool)
+
+
+def _match_boolean(candidate: Any) -> bool:
+    """BOOLEAN widgets accept bools and their common string spellings"""
+    if isinstance(candidate, bool):
+        return True
+    if isinstance(candidate, str):
+        return candidate.lower() in {"true", "false", "enable", "disable"}
+    return False
+
+
+def _match_string(candidate: Any) -> bool:
+    """STRING widgets accept only strings"""
+    return isinstance(candidate, str)
+
+
+def _match_combo(candidate: Any) -> bool:
+    """COMBO widgets accept any primitive choice value"""
+    return isinstance(candidate, (str, int, float, bool))
+
+
+# Widget value matchers keyed by upper-cased ComfyUI input type
+_TYPE_MATCHERS: Dict[str, Callable[[Any], bool]] = {
+    "INT": _match_number,
+    "INTEGER": _match_number,
+    "FLOAT": _match_number,
+    "DOUBLE": _match_number,
+    "BOOLEAN": _match_boolean,
+    "BOOL": _match_boolean,
+    "STRING": _match_string,
+    "COMBO": _match_combo,
+}
+
+
+def _expected_type_tag(expected_type: Any) -> Optional[str]:
+    """Normalize an input type to the upper-cased, interned key used by _TYPE_MATCHERS"""
+    if expected_type is None:
+        return None
+    return sys.intern(str(expected_type).upper())
+
+
+def _matches_expected(expected_tag: Optional[str], candidate: Any) -> bool:
+    """Check if candidate value matches expected type tag (see _expected_type_tag)"""
+    if expected_tag is None:
+        return True
+    if candidate is None:
+        return True
+    matcher = _TYPE_MATCHERS.get(expected_tag)
+    # For other custom types (MODEL, IMAGE, etc.), accept any primitive
+    return matcher is None or matcher(candidate)
+
+
+def _consume_widget_value(
+    widget_values: List[Any],
+    widget_index: int,
+    expected_tag: Optional[str],
+    extra_widget_values: List[Any]
+) -> Tuple[Any, int]:
+    """
+    Consume next widget value matching expected type
+
+    Skipped values are appended to extra_widget_values.
+
+    Returns:
+        Tuple of (matched value or None, next widget index)
+    """
+    while widget_index < len(widget_values):
+        candidate = widget_values[widget_index]
+        widget_index += 1
+        if _matches_expected(expected_tag, candidate):
+            return candidate, widget_index
+        extra_widget_values.append(candidate)
+    return None, widget_index
+
+
+def _build_link_lookup(links: List[Any]) -> Dict[int, Tuple[str, Any]]:
+    """
+    Map link IDs to their source (node_id, output_slot)
+
+    Args:
+        links: Workflow "links" list; each entry is
+            [link_id, from_node_id, from_slot, to_node_id, to_slot, type]
+
+    Returns:
+        Dictionary mapping int link ID to (source_node_id, output_slot)
+    """
+    link_lookup = {}
+    for link in links:
+        if not isinstance(link, list) or len(link) < 5:
+            continue
+        link_id = link[0]
+        # Link IDs are almost always ints; only fall back to parsing otherwise
+        if type(link_id) is not int:
+            try:
+                link_id = int(link_id)
+            except (TypeError, ValueError):
+                continue
+        link_lookup[link_id] = (str(link[1]), link[2])
+    return link_lookup
 
 
 def convert_workflow_to_prompt(workflow_data: dict) -> dict:
@@ -29,18 +139,9 @@ def convert_workflow_to_prompt(workflow_data: dict) -> dict:
         Prompt dictionary in API format
     """
     prompt = {}
-    link_lookup = {}
 
     # Build link lookup table
-    for link in workflow_data.get("links", []):
-        # Expected format: [link_id, from_node_id, from_slot, to_node_id, to_slot, type]
-        if not isinstance(link, list) or len(link) < 5:
-            continue
-        link_id, from_node, from_slot, *_rest = link
-        try:
-            link_lookup[int(link_id)] = (str(from_node), from_slot)
-        except (TypeError, ValueError):
-            continue
+    link_lookup = _build_link_lookup(workflow_data.get("links", []))
 
     extra_meta = workflow_data.get("extra", {}).get("nodeMetadata", {}) or {}
 
@@ -56,41 +157,6 @@ def convert_workflow_to_prompt(workflow_data: dict) -> dict:
         widget_index = 0
         extra_widget_values = []
 
-        def _matches_expected(expected_type, candidate):
-            """Check if candidate value matches expected type"""
-            if expected_type is None:
-                return True
-            if candidate is None:
-                return True
-            expected_upper = str(expected_type).upper()
-            if expected_upper in {"INT", "INTEGER"}:
-                return isinstance(candidate, (int, float)) and not isinstance(candidate, bool)
-            if expected_upper in {"FLOAT", "DOUBLE"}:
-                return isinstance(candidate, (int, float)) and not isinstance(candidate, bool)
-            if expected_upper in {"BOOLEAN", "BOOL"}:
-                if isinstance(candidate, bool):
-                    return True
-                if isinstance(candidate, str):
-                    return candidate.lower() in {"true", "false", "enable", "disable"}
-                return False
-            if expected_upper == "STRING":
-                return isinstance(candidate, str)
-            if expected_upper == "COMBO":
-                return isinstance(candidate, (str, int, float, bool))
-            # For other custom types (MODEL, IMAGE, etc.), accept any primitive
-            return True
-
-        def _consume_widget_value(expected_type):
-            """Consume next widget value matching expected type"""
-            nonlocal widget_index
-            while widget_index < len(widget_values):
-                candidate = widget_values[widget_index]
-                widget_index += 1
-                if _matches_expected(expected_type, candidate):
-                    return candidate
-                extra_widget_values.append(candidate)
-            return None
-
         # Process node inputs
         for input_def in node.get("inputs", []):
             name = input_def.get("name")
@@ -111,7 +177,12 @@ def convert_workflow_to_prompt(workflow_data: dict) -> dict:
 
             # Get value from widgets
             if "widget" in input_def:
-                value = _consume_widget_value(input_def.get("type"))
+                value, widget_index = _consume_widget_value(
+                    widget_values,
+                    widget_index,
+                    _expected_type_tag(input_def.get("type")),
+                    extra_widget_values
+                )
             else:
                 value = None
             inputs_map[name] = value
@@ -126,8 +197,10 @@ def convert_workflow_to_prompt(workflow_data: dict) -> dict:
             "inputs": inputs_map
         }
 
+        # Collect _meta fields locally and attach once
+        meta = {}
+
         # Extract title metadata
-        title = None
         node_properties = node.get("properties") or {}
         title = node_properties.get("Node name for S&R") or node_properties.get("title")
         if not title:
@@ -135,24 +208,48 @@ def convert_workflow_to_prompt(workflow_data: dict) -> dict:
             if isinstance(meta_entry, dict):
                 title = meta_entry.get("title")
         if title:
-            prompt_entry["_meta"] = {"title": title}
+            meta["title"] = title
 
         # Preserve position data for spatial sorting of nodes (fixes image input ordering)
         if "pos" in node:
             pos = node["pos"]
             if isinstance(pos, list) and len(pos) >= 2:
-                prompt_entry.setdefault("_meta", {})["pos"] = pos
+                meta["pos"] = pos
 
         if extra_widget_values:
-            prompt_entry.setdefault("_meta", {}).setdefault("info", {})[
-                "unused_widget_values"
-            ] = extra_widget_values
+            meta["info"] = {"unused_widget_values": extra_widget_values}
+
+        if meta:
+            prompt_entry["_meta"] = meta
 
         prompt[node_id] = prompt_entry
 
     return prompt
 
 
+def _read_json_file(file_path: str) -> Any:
+    """
+    Parse a JSON file, using orjson when it is installed
+
+    orjson is stricter than the stdlib parser (no NaN/Infinity, 64-bit
+    integers only), so documents it rejects are re-parsed with json.
+
+    Raises:
+        ValueError: If file cannot be parsed
+        FileNotFoundError: If file doesn't exist
+    """
+    if orjson is not None:
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            return json.loads(raw.decode('utf-8'))
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
 def load_workflow_from_file(file_path: str) -> Dict[str, Any]:
     """
     Load workflow JSON from file and convert to API format if needed
@@ -167,8 +264,7 @@ def load_workflow_from_file(file_path: str) -> Dict[str, Any]:
         ValueError: If file cannot be parsed
         FileNotFoundError: If file doesn't exist
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = _read_json_file(file_path)
 
     # Check format
     if "nodes" in data and "links" in data: